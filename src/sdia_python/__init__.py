@@ -0,0 +1,18 @@
+"""Python practical sessions G3 - SDIA at Centrale Lille.
+
+The subpackages ``lab1``, ..., ``lab6`` are only imported when first accessed, e.g. ``sdia_python.lab2``, so that ``import sdia_python`` stays cheap.
+"""
+
+import importlib
+
+__all__ = ["lab1", "lab2", "lab3", "lab4", "lab5", "lab6"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,34 @@
+"""Windows and tools to sample, filter and validate points in them.
+
+Names are loaded lazily from their module on first access, e.g. ``from sdia_python.lab2 import BoxWindow`` only imports :py:mod:`sdia_python.lab2.box_window`.
+"""
+
+import importlib
+
+_LAZY_NAMES = {
+    "BoxWindow": "box_window",
+    "UnitBoxWindow": "box_window",
+    "BallWindow": "ball_window",
+    "UnitBallWindow": "ball_window",
+    "filter_points": "point_filter",
+    "open_points": "point_filter",
+    "SAMPLERS": "sampling",
+    "integrate": "sampling",
+    "control_variate_integrate": "sampling",
+    "validate_sampler": "validation",
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        module = importlib.import_module(f"{__name__}.{_LAZY_NAMES[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 from sdia_python.lab2.utils import get_random_number_generator
@@ -62,10 +64,10 @@ class BallWindow:
         n = self.dimension()
         R = self.radius
         if n % 2 == 0:  # formula in case dimension is even
-            return (((np.pi) ** (n / 2)) * R ** n) / np.math.factorial(n / 2)
+            return (((np.pi) ** (n / 2)) * R ** n) / math.factorial(n // 2)
         else:  # formula in case dimension is odd
             odds = np.arange(1, n + 1, 2)
-            product = np.product(odds)
+            product = np.prod(odds)
             return 2 ** ((n + 1) / 2) * np.pi ** ((n - 1) / 2) * R ** n / product
 
     def indicator_function(self, points):
@@ -79,6 +81,20 @@ class BallWindow:
         """
         return np.all([point in self for point in points])
 
+    def contains_points(self, points):
+        """Returns a boolean mask telling which of the ``points`` are in the ball, vectorized over the whole array.
+
+        Args:
+            points (np.array): Array of shape (n, dimension) of points to test.
+
+        Returns:
+            np.array: Boolean array of shape (n,), True where the point is in the ball.
+        """
+        points = np.asarray(points)
+        assert points.ndim == 2 and points.shape[1] == self.dimension()
+        squared_distances = np.sum((points - self.center) ** 2, axis=1)
+        return squared_distances <= self.radius ** 2
+
     def rand(self, n=1, rng=None):
         """Generates n points in the ball.
 
@@ -90,19 +106,14 @@ class BallWindow:
             numpy.array: Array containing the ``n`` generated points.
         """
         rng = get_random_number_generator(rng)
-
-        directions = rng.uniform(size=(n, self.dimension()))
-        directions = np.array(
-            [direction / np.linalg.norm(direction) for direction in directions]
-        )
-        # for the direction to follow a uniform distribution, it is the square root of the radius that must be uniformly distributed
-        distances = rng.uniform(0, np.sqrt(self.radius), n)
-        vectors = np.array(
-            [
-                direction * distance ** 2
-                for (direction, distance) in zip(directions, distances)
-            ]
-        )
+        d = self.dimension()
+
+        # normalized gaussian vectors are uniformly distributed on the sphere
+        directions = rng.standard_normal(size=(n, d))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        # for the points to be uniform in the ball, the distance to the center must follow the CDF (r / R) ** d
+        distances = self.radius * rng.uniform(size=n) ** (1 / d)
+        vectors = directions * distances[:, None]
         return vectors + self.center
 
 
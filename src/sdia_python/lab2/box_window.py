@@ -93,6 +93,21 @@ class BoxWindow:
 
         return np.all([point in self for point in points])
 
+    def contains_points(self, points):
+        """Returns a boolean mask telling which of the ``points`` are in the box, vectorized over the whole array.
+
+        Args:
+            points (np.array): Array of shape (n, dimension) of points to test.
+
+        Returns:
+            np.array: Boolean array of shape (n,), True where the point is in the box.
+        """
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != len(self):
+            raise ValueError("Wrong dimension of points")
+        lower, upper = self.bounds[:, 0], self.bounds[:, 1]
+        return np.all((lower <= points) & (points <= upper), axis=1)
+
     def rand(self, n=1, rng=None):
         """Generates ``n`` points uniformly at random inside the :py:class:`BoxWindow`.
 
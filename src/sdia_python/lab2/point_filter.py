@@ -0,0 +1,118 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+def open_points(path, dimension=None, dtype=np.float64):
+    """Opens a file of points as a read-only memory map, without loading it into memory.
+
+    ``.npy`` files carry their own shape and dtype. Any other file is read as raw binary made of consecutive points of ``dimension`` coordinates of type ``dtype``.
+
+    Args:
+        path (str): Path of the file containing the points.
+        dimension (int, optional): Dimension of the points, required for raw binary files. Defaults to None.
+        dtype (numpy.dtype, optional): Type of the coordinates in raw binary files. Defaults to np.float64.
+
+    Returns:
+        numpy.memmap: Array of shape (n, dimension) mapped on the file.
+    """
+    if str(path).endswith(".npy"):
+        points = np.load(path, mmap_mode="r")
+        if points.ndim != 2:
+            raise ValueError("Points must be stored as a 2D array")
+        return points
+
+    if dimension is None:
+        raise ValueError("The dimension is required to read raw binary points")
+    # numpy cannot map an empty file, e.g. the output of a window that matched no point
+    if os.path.getsize(path) == 0:
+        return np.empty((0, dimension), dtype=dtype)
+    points = np.memmap(path, dtype=dtype, mode="r")
+    if points.size % dimension:
+        raise ValueError("File size is not a multiple of the dimension")
+    return points.reshape(-1, dimension)
+
+
+def iter_chunks(points, chunk_size):
+    """Yields consecutive chunks of ``points`` loaded in memory, reading the next chunk while the current one is being processed.
+
+    Args:
+        points (numpy.array): Array (usually memory mapped) of shape (n, dimension).
+        chunk_size (int): Maximum number of points per chunk.
+
+    Yields:
+        numpy.array: In-memory chunk of at most ``chunk_size`` points.
+    """
+    if chunk_size <= 0:
+        raise ValueError("The chunk size must be positive")
+
+    read = lambda start: np.array(points[start : start + chunk_size])
+    starts = range(0, len(points), chunk_size)
+    # double buffering: one chunk is processed while the next one is read
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = None
+        for start in starts:
+            following = executor.submit(read, start)
+            if pending is not None:
+                yield pending.result()
+            pending = following
+        if pending is not None:
+            yield pending.result()
+
+
+def _is_same_file(path, other):
+    """Returns True if ``path`` and ``other`` designate the same file, ``other`` being an existing file."""
+    if os.path.exists(path):
+        return os.path.samefile(path, other)
+    return os.path.realpath(path) == os.path.realpath(other)
+
+
+def filter_points(
+    source,
+    windows,
+    outputs,
+    dimension=None,
+    dtype=np.float64,
+    chunk_size=1_000_000,
+):
+    """Writes the points of ``source`` contained in each of the ``windows`` to the corresponding file of ``outputs``, processing the points chunk by chunk.
+
+    The points matching ``windows[i]`` are written to ``outputs[i]``, which is overwritten, as raw binary, with the dtype of the source, so that they can be read back with :py:func:`open_points`.
+
+    Args:
+        source (str): Path of the file containing the points, see :py:func:`open_points`.
+        windows (list): Windows (e.g. :py:class:`BoxWindow` or :py:class:`BallWindow`) used to filter the points.
+        outputs (list): Paths of the files where the matching points are written, one per window.
+        dimension (int, optional): Dimension of the points, required for raw binary sources. Defaults to None.
+        dtype (numpy.dtype, optional): Type of the coordinates in raw binary sources. Defaults to np.float64.
+        chunk_size (int, optional): Number of points processed at once. Defaults to 1_000_000.
+
+    Returns:
+        numpy.array: Number of points written for each window.
+    """
+    if len(windows) != len(outputs):
+        raise ValueError("There must be one output per window")
+    # opening an output truncates it, which would destroy a memory mapped source
+    for output in outputs:
+        if _is_same_file(output, source):
+            raise ValueError(f"Output {output} is the source file")
+
+    if chunk_size <= 0:
+        raise ValueError("The chunk size must be positive")
+
+    points = open_points(source, dimension, dtype)
+    if any(window.dimension() != points.shape[1] for window in windows):
+        raise ValueError("Windows and points must have the same dimension")
+    counts = np.zeros(len(windows), dtype=np.int64)
+    files = [open(output, "wb") for output in outputs]
+    try:
+        for chunk in iter_chunks(points, chunk_size):
+            for i, (window, file) in enumerate(zip(windows, files)):
+                selected = chunk[window.contains_points(chunk)]
+                selected.tofile(file)
+                counts[i] += len(selected)
+    finally:
+        for file in files:
+            file.close()
+    return counts
@@ -0,0 +1,149 @@
+import numpy as np
+
+from sdia_python.lab2.ball_window import BallWindow
+from sdia_python.lab2.box_window import BoxWindow
+from sdia_python.lab2.utils import get_random_number_generator
+
+
+def uniform_rand(box, n=1, rng=None):
+    """Generates ``n`` points uniformly at random inside ``box``, vectorized counterpart of :py:meth:`BoxWindow.rand`.
+
+    Args:
+        box (BoxWindow): Box in which the points are generated.
+        n (int, optional): Number of points generated. Defaults to 1.
+        rng (int, optional): Random seed. Defaults to None.
+
+    Returns:
+        numpy.array: Array of shape (n, dimension) containing the generated points.
+    """
+    rng = get_random_number_generator(rng)
+    lower, upper = box.bounds[:, 0], box.bounds[:, 1]
+    return rng.uniform(lower, upper, size=(n, len(box)))
+
+
+def antithetic_rand(box, n=1, rng=None):
+    """Generates ``n`` points inside ``box`` as antithetic pairs: each uniform point :math:`x` is followed by its reflection :math:`2c - x` through the center :math:`c` of the box.
+
+    If ``n`` is odd, the last pair is truncated.
+
+    Args:
+        box (BoxWindow): Box in which the points are generated.
+        n (int, optional): Number of points generated. Defaults to 1.
+        rng (int, optional): Random seed. Defaults to None.
+
+    Returns:
+        numpy.array: Array of shape (n, dimension) containing the generated points.
+    """
+    center = np.mean(box.bounds, axis=1)
+    points = uniform_rand(box, (n + 1) // 2, rng)
+    pairs = np.stack([points, 2 * center - points], axis=1)
+    return pairs.reshape(-1, len(box))[:n]
+
+
+def latin_hypercube_rand(box, n=1, rng=None):
+    """Generates a Latin hypercube design of ``n`` points inside ``box``: along each axis, the segment is cut into ``n`` strata of equal length and each stratum contains exactly one point.
+
+    Args:
+        box (BoxWindow): Box in which the points are generated.
+        n (int, optional): Number of points generated. Defaults to 1.
+        rng (int, optional): Random seed. Defaults to None.
+
+    Returns:
+        numpy.array: Array of shape (n, dimension) containing the generated points.
+    """
+    rng = get_random_number_generator(rng)
+    d = len(box)
+    strata = rng.permuted(np.tile(np.arange(n), (d, 1)), axis=1).T
+    unit_points = (strata + rng.uniform(size=(n, d))) / n
+    lower, upper = box.bounds[:, 0], box.bounds[:, 1]
+    return lower + unit_points * (upper - lower)
+
+
+SAMPLERS = {
+    "uniform": uniform_rand,
+    "antithetic": antithetic_rand,
+    "latin_hypercube": latin_hypercube_rand,
+}
+
+
+def integrate(f, box, n=1, rng=None, method="uniform"):
+    """Estimates :math:`\\int_{box} f` by Monte Carlo, using the sampling strategy ``method``.
+
+    Args:
+        f (callable): Vectorized function mapping an array of shape (n, dimension) to an array of shape (n,).
+        box (BoxWindow): Integration domain.
+        n (int, optional): Number of points used. Defaults to 1.
+        rng (int, optional): Random seed. Defaults to None.
+        method (str, optional): One of the keys of ``SAMPLERS``. Defaults to "uniform".
+
+    Returns:
+        float: Estimate of the integral.
+    """
+    if method not in SAMPLERS:
+        raise ValueError(f"Unknown sampling method {method}")
+    points = SAMPLERS[method](box, n, rng)
+    return box.volume() * np.mean(f(points))
+
+
+def _check_contained(control, box):
+    """Raises a ``ValueError`` if the window ``control`` is not contained in ``box``."""
+    if isinstance(control, BoxWindow):
+        lower, upper = control.bounds[:, 0], control.bounds[:, 1]
+    elif isinstance(control, BallWindow):
+        lower = control.center - control.radius
+        upper = control.center + control.radius
+    else:
+        raise TypeError("The control must be a BoxWindow or a BallWindow")
+
+    if len(control) != len(box):
+        raise ValueError("The control and the box must have the same dimension")
+    if np.any(lower < box.bounds[:, 0]) or np.any(upper > box.bounds[:, 1]):
+        raise ValueError("The control must be contained in the box")
+
+
+def control_variate_integrate(f, box, control, n=1, rng=None, method="uniform"):
+    """Estimates :math:`\\int_{box} f` by Monte Carlo, using the indicator of the window ``control`` as control variate.
+
+    The mean of the control variate is known in closed form, it is ``control.volume() / box.volume()``, hence ``control`` must be contained in ``box``, otherwise a ``ValueError`` is raised.
+    The estimator is :math:`|box| (\\bar{f} - \\beta (\\bar{c} - \\mathbb{E}[c]))` where :math:`\\beta` is the empirical regression coefficient of :math:`f` on :math:`c`.
+
+    .. testcode::
+
+        import numpy as np
+        from sdia_python.lab2.ball_window import BallWindow
+        from sdia_python.lab2.box_window import BoxWindow
+        from sdia_python.lab2.sampling import control_variate_integrate
+
+        ball = BallWindow(np.zeros(2), 1)
+        box = BoxWindow(np.array([[-1, 1], [-1, 1]]))
+        control = BoxWindow(np.array([[-0.7, 0.7], [-0.7, 0.7]]))
+        pi = control_variate_integrate(ball.contains_points, box, control, 10_000, rng=0)
+        print(abs(pi - np.pi) < 0.05)
+
+    .. testoutput::
+
+        True
+
+    Args:
+        f (callable): Vectorized function mapping an array of shape (n, dimension) to an array of shape (n,).
+        box (BoxWindow): Integration domain.
+        control (BoxWindow or BallWindow): Window contained in ``box`` whose indicator is the control variate.
+        n (int, optional): Number of points used. Defaults to 1.
+        rng (int, optional): Random seed. Defaults to None.
+        method (str, optional): One of the keys of ``SAMPLERS``. Defaults to "uniform".
+
+    Returns:
+        float: Estimate of the integral.
+    """
+    if method not in SAMPLERS:
+        raise ValueError(f"Unknown sampling method {method}")
+    _check_contained(control, box)
+    points = SAMPLERS[method](box, n, rng)
+    values = np.asarray(f(points), dtype=float)
+    controls = control.contains_points(points).astype(float)
+    expected_control = control.volume() / box.volume()
+
+    variance = np.var(controls)
+    beta = 0 if variance == 0 else np.cov(values, controls, bias=True)[0, 1] / variance
+    estimate = np.mean(values) - beta * (np.mean(controls) - expected_control)
+    return box.volume() * estimate
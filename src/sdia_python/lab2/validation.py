@@ -0,0 +1,259 @@
+import numpy as np
+
+from sdia_python.lab2.ball_window import BallWindow
+from sdia_python.lab2.box_window import BoxWindow
+from sdia_python.lab2.utils import get_random_number_generator
+
+
+def binned_ks_test(counts):
+    """Kolmogorov-Smirnov test of uniformity on :math:`[0, 1]` of a sample summarized by its histogram over equally spaced bins.
+
+    The statistic is evaluated at the bin edges only, so it is a lower bound of the exact statistic, off by at most the width of a bin.
+
+    Args:
+        counts (numpy.array): Number of points in each bin.
+
+    Returns:
+        tuple: KS statistic and p-value.
+    """
+    # scipy is slow to import, only load it when a test is actually run
+    from scipy import stats
+
+    n = np.sum(counts)
+    ecdf = np.cumsum(counts) / n
+    cdf = np.arange(1, len(counts) + 1) / len(counts)
+    statistic = np.max(np.abs(ecdf - cdf))
+    return statistic, stats.kstwo.sf(statistic, n)
+
+
+def chi_square_test(counts):
+    """Chi-square test that the points are evenly spread over the cells of ``counts``.
+
+    Args:
+        counts (numpy.array): Number of points in each cell, all cells having the same probability.
+
+    Returns:
+        tuple: Chi-square statistic and p-value.
+    """
+    from scipy import stats
+
+    counts = np.ravel(counts)
+    result = stats.chisquare(counts)
+    return result.statistic, result.pvalue
+
+
+def _bin_indices(unit_points, bins):
+    """Returns the index of the bin of width ``1 / bins`` containing each coordinate of ``unit_points``."""
+    return np.clip(np.floor(unit_points * bins).astype(np.int64), 0, bins - 1)
+
+
+class BoxUniformityTest:
+    """Streaming goodness-of-fit tests of the uniform distribution on a :py:class:`BoxWindow`.
+
+    Points are fed by batches with :py:meth:`update`, only histograms are kept in memory.
+    """
+
+    def __init__(self, box, bins=1024, max_cells=2 ** 20):
+        """Initializes the histograms.
+
+        Args:
+            box (BoxWindow): Box on which the points should be uniform.
+            bins (int, optional): Number of bins per axis for the KS tests. Defaults to 1024.
+            max_cells (int, optional): Maximum number of cells of the grid used by the chi-square test and the discrepancy. These tests are skipped when even a grid with 2 cells per axis, i.e. :math:`2^d` cells, is larger. Defaults to 2 ** 20.
+        """
+        if np.any(box.bounds[:, 1] == box.bounds[:, 0]):
+            raise ValueError("The uniform distribution on a flat box is not defined")
+
+        self.box = box
+        self.bins = bins
+        d = len(box)
+        self.cells = int(np.floor(max_cells ** (1 / d) + 1e-9))
+        self.n = 0
+        self.outside = 0
+        self.axis_counts = np.zeros((d, bins), dtype=np.int64)
+        self.grid_counts = (
+            np.zeros(self.cells ** d, dtype=np.int64) if self.cells >= 2 else None
+        )
+
+    def update(self, points):
+        """Adds a batch of points to the histograms.
+
+        Args:
+            points (numpy.array): Array of shape (n, dimension).
+        """
+        inside = self.box.contains_points(points)
+        points = points[inside]
+        self.n += len(points)
+        self.outside += np.count_nonzero(~inside)
+
+        lower, upper = self.box.bounds[:, 0], self.box.bounds[:, 1]
+        unit_points = (points - lower) / (upper - lower)
+        for axis, indices in enumerate(_bin_indices(unit_points, self.bins).T):
+            self.axis_counts[axis] += np.bincount(indices, minlength=self.bins)
+
+        if self.grid_counts is None:
+            return
+        cells = _bin_indices(unit_points, self.cells).T
+        flat = np.ravel_multi_index(tuple(cells), (self.cells,) * len(self.box))
+        self.grid_counts += np.bincount(flat, minlength=self.grid_counts.size)
+
+    def ks_tests(self):
+        """Runs a KS test on each coordinate.
+
+        Returns:
+            list: KS statistic and p-value of each axis, or None if no point was added.
+        """
+        if self.n == 0:
+            return None
+        return [binned_ks_test(counts) for counts in self.axis_counts]
+
+    def chi_square_test(self):
+        """Runs a chi-square test over the cells of the grid.
+
+        Returns:
+            tuple: Chi-square statistic and p-value, or None if the grid would exceed ``max_cells`` or no point was added.
+        """
+        if self.grid_counts is None or self.n == 0:
+            return None
+        return chi_square_test(self.grid_counts)
+
+    def discrepancy(self):
+        r"""Star discrepancy :math:`\sup_x |N([a, x)) / n - |[a, x)| / |box||`, restricted to the corners :math:`x` of the grid.
+
+        Returns:
+            float: Grid estimate of the star discrepancy, a lower bound of the exact one, or None if the grid would exceed ``max_cells`` or no point was added.
+        """
+        if self.grid_counts is None or self.n == 0:
+            return None
+        d = len(self.box)
+        anchored = self.grid_counts.reshape((self.cells,) * d)
+        for axis in range(d):
+            anchored = np.cumsum(anchored, axis=axis)
+        fractions = np.arange(1, self.cells + 1) / self.cells
+        volumes = fractions
+        for _ in range(d - 1):
+            volumes = np.multiply.outer(volumes, fractions)
+        return np.max(np.abs(anchored / self.n - volumes))
+
+    def report(self):
+        """Summarizes all the tests.
+
+        Returns:
+            dict: Results of the tests, the p-values being under the null hypothesis of uniformity.
+        """
+        return {
+            "n": self.n,
+            "outside": self.outside,
+            "ks": self.ks_tests(),
+            "chi_square": self.chi_square_test(),
+            "discrepancy": self.discrepancy(),
+        }
+
+
+class BallUniformityTest:
+    """Streaming goodness-of-fit tests of the uniform distribution on a :py:class:`BallWindow`.
+
+    For uniform points, :math:`(\\|x - c\\| / R)^d` is uniform on :math:`[0, 1]` and all orthants around the center :math:`c` are equally likely.
+    """
+
+    def __init__(self, ball, bins=1024, max_cells=2 ** 20):
+        """Initializes the histograms.
+
+        Args:
+            ball (BallWindow): Ball on which the points should be uniform.
+            bins (int, optional): Number of bins for the radial KS test. Defaults to 1024.
+            max_cells (int, optional): Maximum number of orthants, counted as cells, for the orthant test. The test is skipped when the :math:`2^d` orthants are more. Defaults to 2 ** 20.
+        """
+        if ball.radius == 0:
+            raise ValueError("The uniform distribution on a null ball is not defined")
+
+        self.ball = ball
+        self.bins = bins
+        d = ball.dimension()
+        self.n = 0
+        self.outside = 0
+        self.radial_counts = np.zeros(bins, dtype=np.int64)
+        self.orthant_counts = (
+            np.zeros(2 ** d, dtype=np.int64) if 2 ** d <= max_cells else None
+        )
+
+    def update(self, points):
+        """Adds a batch of points to the histograms.
+
+        Args:
+            points (numpy.array): Array of shape (n, dimension).
+        """
+        inside = self.ball.contains_points(points)
+        points = points[inside]
+        self.n += len(points)
+        self.outside += np.count_nonzero(~inside)
+
+        d = self.ball.dimension()
+        vectors = points - self.ball.center
+        radii = np.linalg.norm(vectors, axis=1) / self.ball.radius
+        indices = _bin_indices(radii ** d, self.bins)
+        self.radial_counts += np.bincount(indices, minlength=self.bins)
+
+        if self.orthant_counts is not None:
+            signs = (vectors >= 0).astype(np.int64)
+            orthants = signs @ (2 ** np.arange(d))
+            self.orthant_counts += np.bincount(orthants, minlength=2 ** d)
+
+    def radial_test(self):
+        """Runs a KS test comparing the distances to the center with their CDF :math:`(r / R)^d`.
+
+        Returns:
+            tuple: KS statistic and p-value, or None if no point was added.
+        """
+        if self.n == 0:
+            return None
+        return binned_ks_test(self.radial_counts)
+
+    def orthant_test(self):
+        """Runs a chi-square test over the orthants around the center.
+
+        Returns:
+            tuple: Chi-square statistic and p-value, or None if the orthants would exceed ``max_cells`` or no point was added.
+        """
+        if self.orthant_counts is None or self.n == 0:
+            return None
+        return chi_square_test(self.orthant_counts)
+
+    def report(self):
+        """Summarizes all the tests.
+
+        Returns:
+            dict: Results of the tests, the p-values being under the null hypothesis of uniformity.
+        """
+        return {
+            "n": self.n,
+            "outside": self.outside,
+            "radial": self.radial_test(),
+            "orthant": self.orthant_test(),
+        }
+
+
+def validate_sampler(window, n, batch_size=10 ** 6, rng=None, **kwargs):
+    """Checks that ``window.rand`` is uniform by drawing ``n`` points by batches of ``batch_size``, so that the whole sample is never held in memory.
+
+    Args:
+        window (BoxWindow or BallWindow): Window whose sampler is tested.
+        n (int): Total number of points drawn.
+        batch_size (int, optional): Number of points drawn at once. Defaults to 10 ** 6.
+        rng (int, optional): Random seed. Defaults to None.
+        **kwargs: Passed to :py:class:`BoxUniformityTest` or :py:class:`BallUniformityTest`.
+
+    Returns:
+        dict: Results of the tests, see the ``report`` methods.
+    """
+    if isinstance(window, BoxWindow):
+        test = BoxUniformityTest(window, **kwargs)
+    elif isinstance(window, BallWindow):
+        test = BallUniformityTest(window, **kwargs)
+    else:
+        raise TypeError("Only BoxWindow and BallWindow samplers can be validated")
+
+    rng = get_random_number_generator(rng)
+    for start in range(0, n, batch_size):
+        test.update(window.rand(min(batch_size, n - start), rng))
+    return test.report()
@@ -136,3 +136,9 @@ def test_unit_ball_initialization(center, dimension, expected):
 def test_unit_ball_initialization_raises_exception_when_mismatched_dimensions():
         with pytest.raises(AssertionError):
             UnitBallWindow(center=np.array([1, 1]), dimension=3)
+
+
+def test_contains_points_matches_contains(ball_2d):
+    points = np.array([[0, 0], [3, 4], [4, 4], [-6, 0]])
+    expected = [point in ball_2d for point in points]
+    assert np.array_equal(ball_2d.contains_points(points), expected)
@@ -133,3 +133,9 @@ def test_raises_exception_when_center_of_wrong_dimension():
 )
 def test_unit_box_initialization(center, dimension, expected):
     assert str(UnitBoxWindow(center, dimension)) == expected
+
+
+def test_contains_points_matches_contains(box_2d_05):
+    points = np.array([[0, 0], [2.5, 6], [5, 5], [-1, 3]])
+    expected = [point in box_2d_05 for point in points]
+    assert np.array_equal(box_2d_05.contains_points(points), expected)
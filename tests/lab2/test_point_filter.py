@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from sdia_python.lab2.ball_window import BallWindow
+from sdia_python.lab2.box_window import BoxWindow
+from sdia_python.lab2.point_filter import filter_points, iter_chunks, open_points
+
+
+@pytest.fixture
+def points_2d():
+    return np.random.default_rng(0).uniform(-2, 2, size=(1000, 2))
+
+
+@pytest.fixture
+def windows_2d():
+    return [BoxWindow(np.array([[0, 1], [0, 1]])), BallWindow(np.array([0, 0]), 1)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 5000])
+def test_iter_chunks_covers_all_points(points_2d, chunk_size):
+    chunks = list(iter_chunks(points_2d, chunk_size))
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), points_2d)
+
+
+def test_open_points_raw_binary_requires_dimension(tmp_path, points_2d):
+    path = tmp_path / "points.bin"
+    points_2d.tofile(path)
+    with pytest.raises(ValueError):
+        open_points(path)
+    assert np.array_equal(open_points(path, dimension=2), points_2d)
+
+
+def test_open_points_empty_raw_binary(tmp_path, windows_2d):
+    path = tmp_path / "empty.bin"
+    path.touch()
+    assert open_points(path, dimension=2).shape == (0, 2)
+
+    outputs = [tmp_path / f"window_{i}.bin" for i in range(len(windows_2d))]
+    counts = filter_points(path, windows_2d, outputs, dimension=2)
+    assert np.array_equal(counts, [0, 0])
+
+
+@pytest.mark.parametrize("extension", [".npy", ".bin"])
+def test_filter_points_matches_in_memory_filtering(
+    tmp_path, points_2d, windows_2d, extension
+):
+    source = tmp_path / f"points{extension}"
+    if extension == ".npy":
+        np.save(source, points_2d)
+    else:
+        points_2d.tofile(source)
+    outputs = [tmp_path / f"window_{i}.bin" for i in range(len(windows_2d))]
+
+    counts = filter_points(source, windows_2d, outputs, dimension=2, chunk_size=64)
+
+    for window, output, count in zip(windows_2d, outputs, counts):
+        expected = np.array([point for point in points_2d if point in window])
+        written = open_points(output, dimension=2)
+        assert count == len(expected)
+        assert np.array_equal(written, expected)
+
+
+def test_filter_points_raises_exception_when_outputs_mismatch(
+    tmp_path, points_2d, windows_2d
+):
+    source = tmp_path / "points.npy"
+    np.save(source, points_2d)
+    with pytest.raises(ValueError):
+        filter_points(source, windows_2d, [tmp_path / "out.bin"])
+
+
+def test_filter_points_raises_exception_when_output_is_source(
+    tmp_path, points_2d, windows_2d
+):
+    source = tmp_path / "points.bin"
+    points_2d.tofile(source)
+    outputs = [
+        tmp_path / "window_0.bin",
+        tmp_path / ".." / tmp_path.name / "points.bin",
+    ]
+    with pytest.raises(ValueError):
+        filter_points(source, windows_2d, outputs, dimension=2)
+    assert np.array_equal(open_points(source, dimension=2), points_2d)
+
+
+@pytest.mark.parametrize(
+    "windows, chunk_size",
+    [
+        ([BoxWindow(np.array([[0, 1], [0, 1]]))], 0),
+        ([BoxWindow(np.array([[0, 1], [0, 1], [0, 1]]))], 64),
+        ([BallWindow(np.array([0]), 1)], 64),
+    ],
+)
+def test_filter_points_keeps_outputs_when_arguments_are_invalid(
+    tmp_path, points_2d, windows, chunk_size
+):
+    source = tmp_path / "points.npy"
+    np.save(source, points_2d)
+    output = tmp_path / "window_0.bin"
+    output.write_bytes(b"precious")
+    with pytest.raises(ValueError):
+        filter_points(source, windows, [output], chunk_size=chunk_size)
+    assert output.read_bytes() == b"precious"
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from sdia_python.lab2.ball_window import BallWindow
+from sdia_python.lab2.box_window import BoxWindow
+from sdia_python.lab2.sampling import (
+    SAMPLERS,
+    antithetic_rand,
+    control_variate_integrate,
+    integrate,
+    latin_hypercube_rand,
+)
+
+
+@pytest.fixture
+def box_3d():
+    return BoxWindow(np.array([[0, 5], [0.5, 1.5], [-2, 3]]))
+
+
+@pytest.mark.parametrize("method", SAMPLERS)
+@pytest.mark.parametrize("n", [1, 10, 11])
+def test_samplers_generate_points_in_box(box_3d, method, n):
+    points = SAMPLERS[method](box_3d, n, rng=0)
+    assert points.shape == (n, len(box_3d))
+    assert np.all(box_3d.contains_points(points))
+
+
+@pytest.mark.parametrize("method", SAMPLERS)
+def test_samplers_are_reproducible(box_3d, method):
+    sampler = SAMPLERS[method]
+    assert np.array_equal(sampler(box_3d, 20, rng=42), sampler(box_3d, 20, rng=42))
+
+
+def test_antithetic_pairs_are_symmetric_around_center(box_3d):
+    points = antithetic_rand(box_3d, 10, rng=0)
+    center = np.mean(box_3d.bounds, axis=1)
+    assert np.allclose(points[::2] + points[1::2], 2 * center)
+
+
+def test_latin_hypercube_has_one_point_per_stratum(box_3d):
+    n = 50
+    points = latin_hypercube_rand(box_3d, n, rng=0)
+    lower, upper = box_3d.bounds[:, 0], box_3d.bounds[:, 1]
+    strata = np.floor((points - lower) / (upper - lower) * n)
+    for axis in range(len(box_3d)):
+        assert np.array_equal(np.sort(strata[:, axis]), np.arange(n))
+
+
+def test_antithetic_integrates_linear_function_exactly(box_3d):
+    f = lambda points: points @ np.array([1.0, -2.0, 3.0])
+    exact = box_3d.volume() * f(np.mean(box_3d.bounds, axis=1)[None, :])[0]
+    assert np.isclose(integrate(f, box_3d, 10, rng=0, method="antithetic"), exact)
+
+
+def test_unknown_method_raises_exception(box_3d):
+    with pytest.raises(ValueError):
+        integrate(lambda points: points[:, 0], box_3d, 10, method="sobol")
+
+
+def test_control_variate_reduces_variance():
+    ball = BallWindow(np.zeros(2), 1)
+    box = BoxWindow(np.array([[-1, 1], [-1, 1]]))
+    control = BoxWindow(np.array([[-0.7, 0.7], [-0.7, 0.7]]))
+    rng = np.random.default_rng(0)
+
+    plain = [integrate(ball.contains_points, box, 1000, rng) for _ in range(200)]
+    controlled = [
+        control_variate_integrate(ball.contains_points, box, control, 1000, rng)
+        for _ in range(200)
+    ]
+    assert abs(np.mean(controlled) - np.pi) < 0.02
+    assert np.var(controlled) < np.var(plain)
+
+
+@pytest.mark.parametrize(
+    "control",
+    [
+        BoxWindow(np.array([[-0.5, 1.5], [-0.5, 0.5]])),
+        BallWindow(np.array([0.5, 0]), 0.7),
+        BallWindow(np.zeros(3), 0.5),
+    ],
+)
+def test_control_variate_raises_exception_when_control_not_in_box(control):
+    box = BoxWindow(np.array([[-1, 1], [-1, 1]]))
+    with pytest.raises(ValueError):
+        control_variate_integrate(lambda points: points[:, 0], box, control, 10)
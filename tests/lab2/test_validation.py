@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from sdia_python.lab2.ball_window import BallWindow
+from sdia_python.lab2.box_window import BoxWindow
+from sdia_python.lab2.validation import (
+    BallUniformityTest,
+    BoxUniformityTest,
+    binned_ks_test,
+    validate_sampler,
+)
+
+
+@pytest.mark.parametrize(
+    "counts, expected",
+    [(np.array([10, 10, 10, 10]), 0), (np.array([40, 0, 0, 0]), 0.75)],
+)
+def test_binned_ks_statistic(counts, expected):
+    statistic, _ = binned_ks_test(counts)
+    assert np.isclose(statistic, expected)
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        np.array([[3, 6]]),
+        np.array([[0, 5], [-1, 1]]),
+        np.array([[0, 5], [0.5, 1.5], [2, 3]]),
+    ],
+)
+def test_box_sampler_passes_validation(bounds):
+    report = validate_sampler(BoxWindow(bounds), 100_000, batch_size=30_000, rng=0)
+    assert report["n"] == 100_000
+    assert report["outside"] == 0
+    assert all(pvalue > 1e-3 for _, pvalue in report["ks"])
+    assert report["chi_square"][1] > 1e-3
+    assert report["discrepancy"] < 0.01
+
+
+def test_high_dimensional_box_skips_grid_tests():
+    box = BoxWindow(np.tile([0, 1], (40, 1)))
+    report = validate_sampler(box, 10_000, rng=0)
+    assert report["chi_square"] is None
+    assert report["discrepancy"] is None
+    assert all(pvalue > 1e-3 for _, pvalue in report["ks"])
+
+
+@pytest.mark.parametrize(
+    "window, skipped",
+    [
+        (BoxWindow(np.tile([0, 1], (3, 1))), ["chi_square", "discrepancy"]),
+        (BallWindow(np.zeros(3), 1), ["orthant"]),
+    ],
+)
+def test_max_cells_limits_grid_tests_of_all_windows(window, skipped):
+    report = validate_sampler(window, 1000, rng=0, max_cells=4)
+    assert all(report[test] is None for test in skipped)
+
+
+@pytest.mark.parametrize(
+    "center, radius",
+    [(np.array([5]), 2), (np.array([3, 6]), 5), (np.array([0, 5, 8]), 3)],
+)
+def test_ball_sampler_passes_validation(center, radius):
+    report = validate_sampler(BallWindow(center, radius), 100_000, 30_000, rng=0)
+    assert report["n"] == 100_000
+    assert report["outside"] == 0
+    assert report["radial"][1] > 1e-3
+    assert report["orthant"][1] > 1e-3
+
+
+def test_box_validation_detects_non_uniform_points():
+    box = BoxWindow(np.array([[0, 1], [0, 1]]))
+    test = BoxUniformityTest(box)
+    test.update(np.random.default_rng(0).uniform(size=(10_000, 2)) ** 2)
+    report = test.report()
+    assert all(pvalue < 1e-6 for _, pvalue in report["ks"])
+    assert report["chi_square"][1] < 1e-6
+    assert report["discrepancy"] > 0.1
+
+
+def test_ball_validation_detects_non_uniform_radius():
+    ball = BallWindow(np.zeros(2), 1)
+    test = BallUniformityTest(ball)
+    directions = np.random.default_rng(0).standard_normal(size=(10_000, 2))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    test.update(directions * np.random.default_rng(1).uniform(size=(10_000, 1)))
+    assert test.radial_test()[1] < 1e-6
+
+
+def test_box_validation_raises_exception_for_flat_box():
+    with pytest.raises(ValueError):
+        BoxUniformityTest(BoxWindow(np.array([[0, 1], [2, 2]])))
+
+
+def test_ball_validation_raises_exception_for_zero_radius():
+    with pytest.raises(ValueError):
+        BallUniformityTest(BallWindow(np.zeros(2), 0))
+
+
+def test_reports_without_points():
+    box_report = BoxUniformityTest(BoxWindow(np.array([[0, 1], [0, 1]]))).report()
+    ball_report = BallUniformityTest(BallWindow(np.zeros(2), 1)).report()
+    assert box_report["n"] == 0 and ball_report["n"] == 0
+    assert box_report["ks"] is None
+    assert box_report["chi_square"] is None
+    assert box_report["discrepancy"] is None
+    assert ball_report["radial"] is None
+    assert ball_report["orthant"] is None
+
+
+def test_validate_sampler_raises_exception_for_unknown_window():
+    with pytest.raises(TypeError):
+        validate_sampler(object(), 10)
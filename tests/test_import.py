@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# maximum time, in seconds, taken by ``import sdia_python`` in a fresh interpreter
+IMPORT_TIME_BUDGET = 0.1
+
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_time_is_within_budget():
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import sdia_python\n"
+        "print(time.perf_counter() - start)"
+    )
+    # keep the best of a few runs to smooth out the noise of the machine
+    elapsed = min(float(run_python(code)) for _ in range(3))
+    assert elapsed < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize(
+    "statement, unexpected",
+    [
+        ("import sdia_python", "numpy"),
+        ("import sdia_python.lab2", "numpy"),
+        ("from sdia_python.lab2 import BoxWindow", "sdia_python.lab2.ball_window"),
+        ("import sdia_python.lab2.validation", "scipy"),
+    ],
+)
+def test_heavy_modules_are_imported_lazily(statement, unexpected):
+    code = f"import sys\n{statement}\nprint({unexpected!r} in sys.modules)"
+    assert run_python(code) == "False"
+
+
+def test_lazy_attributes_are_resolved():
+    import sdia_python
+    from sdia_python.lab2 import BallWindow
+    from sdia_python.lab2.ball_window import BallWindow as ball_window_class
+
+    assert sdia_python.lab2.BallWindow is ball_window_class
+    assert BallWindow is ball_window_class
+    with pytest.raises(AttributeError):
+        sdia_python.lab7